@@ -30,16 +30,20 @@ Usage:
 │ Demo 1/5 — PreToolUse: Block Dangerous Bash Commands                         │
 └──────────────────────────────────────────────────────────────────────────────┘
 
+import re
 from easyCcHooks import IPreToolUse, PreToolUseInput, PreToolUseOutput, ToolName
 
 class DenyDangerousRm(IPreToolUse):
+    # One pass over the command: "rm ... -rf ... /" at the end of the line
+    _DENY_RE = re.compile(r"\\brm\\b.*\\s-rf\\s.*/\\s*$")
+
     @property
     def matcher(self) -> str:
         return ToolName.Bash
 
     def execute(self, input_data: PreToolUseInput) -> PreToolUseOutput:
         cmd = input_data.tool_input.get("command", "")
-        if "rm " in cmd and " -rf " in cmd and cmd.rstrip().endswith("/"):
+        if self._DENY_RE.search(cmd):
             return PreToolUseOutput(
                 permission_decision="deny",
                 permission_decision_reason="Root directory deletion is forbidden"
@@ -83,12 +87,16 @@ class ProjectInfo(ISessionStart):
 │ Demo 4/5 — UserPromptSubmit: Filter Sensitive Information                    │
 └──────────────────────────────────────────────────────────────────────────────┘
 
+import re
 from easyCcHooks import IUserPromptSubmit, UserPromptSubmitInput, UserPromptSubmitOutput
 
 class FilterSecrets(IUserPromptSubmit):
+    # Compiled once at class load, not on every prompt. Key prefix followed by 10+
+    # non-space, non-quote chars; for many patterns consider one fused RE2 regex
+    _SECRET_RE = re.compile(r"\\b(?:sk-|AKIA|ghp_|xox[bsp]-)[^\\s\\"'`]{10,}")
+
     def execute(self, input_data: UserPromptSubmitInput) -> UserPromptSubmitOutput:
-        import re
-        if re.search(r"(sk-|AKIA|ghp_|xox[bsp]-)\\w{10,}", input_data.prompt):
+        if self._SECRET_RE.search(input_data.prompt):
             return UserPromptSubmitOutput(
                 decision="block",
                 reason="Possible API Key detected, please remove before submitting"
@@ -108,18 +116,22 @@ class PreventStop(IStop):
         return StopOutput()
 """
 
+import os
 import sys
 import json
-import inspect
-import argparse
-import importlib.util
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from datetime import datetime
-from dataclasses import dataclass, asdict, field
-from typing import Optional, Dict, Any, List, Type, Literal, TypeVar
+from dataclasses import dataclass, field
+from typing import Optional, ClassVar, Dict, Any, FrozenSet, List, Set, Tuple, Type, TypeVar
 from enum import Enum
 
+try:
+    # Optional C JSON accelerator for hook I/O, stdlib json is used when not installed
+    import orjson
+except ImportError:
+    orjson = None
+
 T = TypeVar('T')
 
 __version__ = "0.1.0"
@@ -131,6 +143,64 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 _VERSION_URL = "https://raw.githubusercontent.com/e1roy/easyCcHooks/refs/heads/main/version.txt"
 _REMOTE_PY_URL = "https://raw.githubusercontent.com/e1roy/easyCcHooks/refs/heads/main/.claude/hooks/easyCcHooks.py"
 
+# Command prefix of hook entries generated (and owned) by update-config
+_MANAGED_COMMAND_PREFIX = 'python3 "$CLAUDE_PROJECT_DIR"/.claude/hooks/easyCcHooks.py execute '
+
+# Hook types whose settings.json entries take a tool matcher
+_TOOL_LEVEL_HOOK_TYPES = frozenset({"PreToolUse", "PermissionRequest", "PostToolUse", "Notification", "PreCompact"})
+
+# Scan cache: per hook file stat + registered classes, used to skip unchanged files
+_SCAN_CACHE_FILE = ".easycchooks_cache.json"
+
+# sys.modules namespace for scanned hook files, keeps one module object per file
+_SCAN_MODULE_PREFIX = "easycchooks._scan."
+
+# Optional list of hook files (one relative path per line); when present, the directory is not walked
+_HOOKS_MANIFEST_FILE = "easycchooks.manifest"
+
+# Directories never descended into while scanning (hidden directories are skipped as well)
+_SCAN_SKIP_DIRS = frozenset({"__pycache__", "venv", "node_modules"})
+
+
+# ============================================================================
+# JSON Helpers - orjson when available, stdlib json otherwise
+# ============================================================================
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON string, non-ASCII characters are kept as-is (compact unless indent)"""
+    if orjson is not None:
+        return _json_dumps_bytes(obj, indent).decode("utf-8")
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_dumps_bytes(obj: Any, indent: bool = False, newline: bool = False) -> bytes:
+    """Serialize to UTF-8 encoded JSON bytes (orjson produces bytes directly), optionally newline-terminated"""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: accept int/float keys like stdlib json does
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, option=option)
+    text = _json_dumps(obj, indent)
+    return (text + "\n" if newline else text).encode("utf-8")
+
+
+def _write_json_line(obj: Any):
+    """Write compact JSON plus newline to stdout as bytes, bypassing the text layer"""
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    out.write(_json_dumps_bytes(obj, newline=True))
+    out.flush()
+
 
 # ============================================================================
 # Tool Name Enumeration - For matcher matching
@@ -173,11 +243,21 @@ class ToolName(str, Enum):
     All = "*"
 
 
+# ============================================================================
+# Decision Values - interned, output decision fields are interned on construction
+# ============================================================================
+
+ALLOW = sys.intern("allow")
+DENY = sys.intern("deny")
+ASK = sys.intern("ask")
+BLOCK = sys.intern("block")
+
+
 # ============================================================================
 # Data Models - Common Base Classes
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class HookInputBase:
     """Hook input base class - fields common to all hooks"""
     session_id: str
@@ -188,30 +268,101 @@ class HookInputBase:
 
     @classmethod
     def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
-        """Create instance from dictionary"""
-        fields = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
-        return cls(**fields)
+        """Create instance from dictionary (unknown keys are ignored)"""
+        return cls(**{k: data[k] for k in data.keys() & cls._field_set()})
+
+    @classmethod
+    def _field_names(cls) -> Tuple[str, ...]:
+        """Dataclass field names, cached per class on first use"""
+        names = cls.__dict__.get("_FIELDS")
+        if names is None:
+            names = tuple(cls.__dataclass_fields__)
+            cls._FIELDS = names
+        return names
+
+    @classmethod
+    def _field_set(cls) -> FrozenSet[str]:
+        """Dataclass field names as frozenset for key intersection, cached per class"""
+        field_set = cls.__dict__.get("_FIELD_SET")
+        if field_set is None:
+            field_set = frozenset(cls._field_names())
+            cls._FIELD_SET = field_set
+        return field_set
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return asdict(self)
+        """Convert to dictionary (shallow copy, nested tool payloads are shared)"""
+        return {name: getattr(self, name) for name in self._field_names()}
 
 
-@dataclass
+# Output schema emit modes - when a field is written to the output dict
+_EMIT_ALWAYS = 0            # always
+_EMIT_TRUTHY = 1            # value is truthy
+_EMIT_NOT_NONE = 2          # value is not None
+_EMIT_BLOCK_DECISION = 3    # value == BLOCK
+_EMIT_BLOCK_REASON = 4      # value is truthy and decision == BLOCK
+
+# Top-level decision/reason pair shared by blocking outputs
+_BLOCK_SCHEMA = (
+    ("decision", ("decision",), _EMIT_BLOCK_DECISION),
+    ("reason", ("reason",), _EMIT_BLOCK_REASON),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class HookOutputBase:
-    """Hook output base class"""
+    """Hook output base class
+
+    Subclasses describe their JSON output with _SCHEMA entries
+    (attribute, key path, emit mode) instead of overriding to_dict;
+    a "hookSpecificOutput" object is created with hookEventName = _EVENT on first use.
+    Outputs are frozen: build them with keyword arguments (or dataclasses.replace).
+    """
     continue_execution: bool = True
     suppress_output: bool = False
     system_message: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        result = {}
+    _EVENT: ClassVar[str] = ""
+    _SCHEMA: ClassVar[Tuple[Tuple[str, Tuple[str, ...], int], ...]] = ()
+    # Decision fields interned in __post_init__ so they share identity with ALLOW / DENY / ASK / BLOCK
+    _INTERNED: ClassVar[Tuple[str, ...]] = ()
+
+    def __post_init__(self):
+        for attr in self._INTERNED:
+            value = getattr(self, attr)
+            if type(value) is str:
+                # Outputs are frozen, so bypass the generated __setattr__
+                object.__setattr__(self, attr, sys.intern(value))
+
+    def to_dict(self, out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Serialize to the hook JSON dict, filling out in place when given (no intermediate copy)"""
+        result = {} if out is None else out
         if not self.continue_execution:
             result["continue"] = False
         if self.suppress_output:
             result["suppressOutput"] = True
         if self.system_message:
             result["systemMessage"] = self.system_message
+        for attr, path, mode in self._SCHEMA:
+            value = getattr(self, attr)
+            if mode == _EMIT_TRUTHY:
+                if not value:
+                    continue
+            elif mode == _EMIT_NOT_NONE:
+                if value is None:
+                    continue
+            elif mode == _EMIT_BLOCK_DECISION:
+                if value != BLOCK:
+                    continue
+            elif mode == _EMIT_BLOCK_REASON:
+                if not value or self.decision != BLOCK:
+                    continue
+            target = result
+            for key in path[:-1]:
+                node = target.get(key)
+                if node is None:
+                    node = target[key] = {"hookEventName": self._EVENT} if key == "hookSpecificOutput" else {}
+                target = node
+            target[path[-1]] = value
         return result
 
 
@@ -219,69 +370,60 @@ class HookOutputBase:
 # 数据模型 - PreToolUse
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PreToolUseInput(HookInputBase):
     tool_name: str = ""
     tool_input: Dict[str, Any] = field(default_factory=dict)
     tool_use_id: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PreToolUseOutput(HookOutputBase):
-    permission_decision: Literal["allow", "deny", "ask"] = "allow"
+    permission_decision: str = ALLOW                # ALLOW / DENY / ASK
     permission_decision_reason: str = ""
     updated_input: Optional[Dict[str, Any]] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        result = super().to_dict()
-        result["hookSpecificOutput"] = {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": self.permission_decision,
-            "permissionDecisionReason": self.permission_decision_reason,
-        }
-        if self.updated_input is not None:
-            result["hookSpecificOutput"]["updatedInput"] = self.updated_input
-        return result
+    _EVENT = "PreToolUse"
+    _INTERNED = ("permission_decision",)
+    _SCHEMA = (
+        ("permission_decision", ("hookSpecificOutput", "permissionDecision"), _EMIT_ALWAYS),
+        ("permission_decision_reason", ("hookSpecificOutput", "permissionDecisionReason"), _EMIT_ALWAYS),
+        ("updated_input", ("hookSpecificOutput", "updatedInput"), _EMIT_NOT_NONE),
+    )
 
 
 # ============================================================================
 # 数据模型 - PermissionRequest
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PermissionRequestInput(HookInputBase):
     tool_name: str = ""
     tool_input: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PermissionRequestOutput(HookOutputBase):
-    behavior: Literal["allow", "deny"] = "allow"
+    behavior: str = ALLOW                           # ALLOW / DENY
     message: Optional[str] = None
     interrupt: bool = False
     updated_input: Optional[Dict[str, Any]] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        result = super().to_dict()
-        decision = {"behavior": self.behavior}
-        if self.message:
-            decision["message"] = self.message
-        if self.interrupt:
-            decision["interrupt"] = True
-        if self.updated_input is not None:
-            decision["updatedInput"] = self.updated_input
-        result["hookSpecificOutput"] = {
-            "hookEventName": "PermissionRequest",
-            "decision": decision
-        }
-        return result
+    _EVENT = "PermissionRequest"
+    _INTERNED = ("behavior",)
+    _SCHEMA = (
+        ("behavior", ("hookSpecificOutput", "decision", "behavior"), _EMIT_ALWAYS),
+        ("message", ("hookSpecificOutput", "decision", "message"), _EMIT_TRUTHY),
+        ("interrupt", ("hookSpecificOutput", "decision", "interrupt"), _EMIT_TRUTHY),
+        ("updated_input", ("hookSpecificOutput", "decision", "updatedInput"), _EMIT_NOT_NONE),
+    )
 
 
 # ============================================================================
 # 数据模型 - PostToolUse
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PostToolUseInput(HookInputBase):
     tool_name: str = ""
     tool_input: Dict[str, Any] = field(default_factory=dict)
@@ -289,66 +431,52 @@ class PostToolUseInput(HookInputBase):
     tool_use_id: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PostToolUseOutput(HookOutputBase):
-    decision: Optional[Literal["block"]] = None
+    decision: Optional[str] = None                  # BLOCK or None
     reason: Optional[str] = None
     additional_context: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        result = super().to_dict()
-        if self.decision == "block":
-            result["decision"] = "block"
-            if self.reason:
-                result["reason"] = self.reason
-        if self.additional_context:
-            result["hookSpecificOutput"] = {
-                "hookEventName": "PostToolUse",
-                "additionalContext": self.additional_context
-            }
-        return result
+    _EVENT = "PostToolUse"
+    _INTERNED = ("decision",)
+    _SCHEMA = _BLOCK_SCHEMA + (
+        ("additional_context", ("hookSpecificOutput", "additionalContext"), _EMIT_TRUTHY),
+    )
 
 
 # ============================================================================
 # 数据模型 - UserPromptSubmit
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class UserPromptSubmitInput(HookInputBase):
     prompt: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserPromptSubmitOutput(HookOutputBase):
-    decision: Optional[Literal["block"]] = None
+    decision: Optional[str] = None                  # BLOCK or None
     reason: Optional[str] = None
     additional_context: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        result = super().to_dict()
-        if self.decision == "block":
-            result["decision"] = "block"
-            if self.reason:
-                result["reason"] = self.reason
-        if self.additional_context:
-            result["hookSpecificOutput"] = {
-                "hookEventName": "UserPromptSubmit",
-                "additionalContext": self.additional_context
-            }
-        return result
+    _EVENT = "UserPromptSubmit"
+    _INTERNED = ("decision",)
+    _SCHEMA = _BLOCK_SCHEMA + (
+        ("additional_context", ("hookSpecificOutput", "additionalContext"), _EMIT_TRUTHY),
+    )
 
 
 # ============================================================================
 # 数据模型 - Notification
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class NotificationInput(HookInputBase):
     message: str = ""
     notification_type: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NotificationOutput(HookOutputBase):
     pass
 
@@ -357,59 +485,49 @@ class NotificationOutput(HookOutputBase):
 # 数据模型 - Stop
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class StopInput(HookInputBase):
     stop_hook_active: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StopOutput(HookOutputBase):
-    decision: Optional[Literal["block"]] = None
+    decision: Optional[str] = None                  # BLOCK or None
     reason: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        result = super().to_dict()
-        if self.decision == "block":
-            result["decision"] = "block"
-            if self.reason:
-                result["reason"] = self.reason
-        return result
+    _INTERNED = ("decision",)
+    _SCHEMA = _BLOCK_SCHEMA
 
 
 # ============================================================================
 # 数据模型 - SubagentStop
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SubagentStopInput(HookInputBase):
     stop_hook_active: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SubagentStopOutput(HookOutputBase):
-    decision: Optional[Literal["block"]] = None
+    decision: Optional[str] = None                  # BLOCK or None
     reason: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        result = super().to_dict()
-        if self.decision == "block":
-            result["decision"] = "block"
-            if self.reason:
-                result["reason"] = self.reason
-        return result
+    _INTERNED = ("decision",)
+    _SCHEMA = _BLOCK_SCHEMA
 
 
 # ============================================================================
 # 数据模型 - PreCompact
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PreCompactInput(HookInputBase):
-    trigger: Literal["manual", "auto"] = "manual"
+    trigger: str = "manual"                         # "manual" / "auto"
     custom_instructions: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PreCompactOutput(HookOutputBase):
     pass
 
@@ -418,35 +536,31 @@ class PreCompactOutput(HookOutputBase):
 # 数据模型 - SessionStart
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SessionStartInput(HookInputBase):
-    source: Literal["startup", "resume", "clear", "compact"] = "startup"
+    source: str = "startup"                         # "startup" / "resume" / "clear" / "compact"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SessionStartOutput(HookOutputBase):
     additional_context: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        result = super().to_dict()
-        if self.additional_context:
-            result["hookSpecificOutput"] = {
-                "hookEventName": "SessionStart",
-                "additionalContext": self.additional_context
-            }
-        return result
+    _EVENT = "SessionStart"
+    _SCHEMA = (
+        ("additional_context", ("hookSpecificOutput", "additionalContext"), _EMIT_TRUTHY),
+    )
 
 
 # ============================================================================
 # 数据模型 - SessionEnd
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SessionEndInput(HookInputBase):
-    reason: Literal["clear", "logout", "prompt_input_exit", "other"] = "other"
+    reason: str = "other"                           # "clear" / "logout" / "prompt_input_exit" / "other"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SessionEndOutput(HookOutputBase):
     pass
 
@@ -468,6 +582,12 @@ INPUT_MODEL_MAP: Dict[str, Type[HookInputBase]] = {
     "SessionEnd": SessionEndInput,
 }
 
+# Build the field-name caches of the built-in input models once at import,
+# so from_dict is a plain frozenset & keys intersection on the execute path
+for _input_model in INPUT_MODEL_MAP.values():
+    _input_model._field_set()
+del _input_model
+
 
 # ============================================================================
 # Abstract Base Classes
@@ -476,6 +596,15 @@ INPUT_MODEL_MAP: Dict[str, Type[HookInputBase]] = {
 class BaseHook(ABC):
     """Hook abstract base class"""
 
+    _description: str = "No description"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # First docstring line, parsed once per class
+        doc = cls.__doc__
+        first_line = doc.strip().split("\n", 1)[0].strip() if doc else ""
+        cls._description = first_line or "No description"
+
     @abstractmethod
     def execute(self, input_data: HookInputBase) -> HookOutputBase:
         pass
@@ -486,11 +615,7 @@ class BaseHook(ABC):
 
     @property
     def description(self) -> str:
-        doc = self.__class__.__doc__
-        if doc:
-            lines = [line.strip() for line in doc.strip().split('\n') if line.strip()]
-            return lines[0] if lines else "No description"
-        return "No description"
+        return self._description
 
     @property
     def matcher(self) -> str:
@@ -643,72 +768,403 @@ class HookRegistry:
         "SessionEnd": ISessionEnd,
     }
 
+    # Registered class names per hook type, for O(1) deduplication in register
+    _registered: Dict[str, Set[str]] = {hook_type: set() for hook_type in _hooks}
+
+    # Class name -> first registered class, maintained by register for O(1) get_hook
+    _hooks_by_name: Dict[str, Type[BaseHook]] = {}
+
+    # Number of (hook type, class) registrations, maintained by register (see count)
+    _count: int = 0
+
+    # Registration messages buffered while scan_and_register runs, written once at the end
+    _pending_log: Optional[List[str]] = None
+
+    # None until scanned, then whether the last full scan included tests/
+    _scanned_tests: Optional[bool] = None
+
+    # Hook instances shared by generate_config / list_hooks (see _probe)
+    _instance_cache: Dict[Type[BaseHook], BaseHook] = {}
+
+    # Resolved matcher / timeout per hook class (see _get_meta)
+    _meta_cache: Dict[Type[BaseHook], Dict[str, Any]] = {}
+
+    # Reverse lookup: interface class -> hook type, matched against each class's MRO
+    _INTERFACE_EVENTS: Dict[Type, str] = {interface: hook_type for hook_type, interface in _INTERFACE_MAP.items()}
+
+    # Hook types implemented by each class seen since the last invalidate() (see _events_of)
+    _class_events: Dict[Type, Tuple[str, ...]] = {}
+
     @classmethod
-    def register(cls, hook_type: str, hook_class: Type[BaseHook], quiet: bool = False):
-        """Register hook"""
+    def register(cls, hook_type: str, hook_class: Type[BaseHook], quiet: bool = False,
+                 config_accumulator: Optional[Dict[str, List[dict]]] = None):
+        """Register hook, appending its settings.json entry to config_accumulator when given"""
         if hook_type not in cls._hooks:
             raise ValueError(f"Unknown hook type: {hook_type}")
         # Deduplicate by class name to avoid different class objects from repeated importlib loading
-        existing_names = [h.__name__ for h in cls._hooks[hook_type]]
-        if hook_class.__name__ in existing_names:
+        registered = cls._registered[hook_type]
+        if hook_class.__name__ in registered:
             return
+        registered.add(hook_class.__name__)
         cls._hooks[hook_type].append(hook_class)
+        cls._hooks_by_name.setdefault(hook_class.__name__, hook_class)
+        cls._count += 1
+        if config_accumulator is not None:
+            entry = cls._config_entry(hook_type, hook_class)
+            if entry is not None:
+                config_accumulator.setdefault(hook_type, []).append(entry)
         if not quiet:
-            print(f"✓ Registered: {hook_type}.{hook_class.__name__}")
+            # Logs go to stderr so they never mix with hook JSON on stdout; buffered during a scan
+            line = f"✓ Registered: {hook_type}.{hook_class.__name__}\n"
+            if cls._pending_log is not None:
+                cls._pending_log.append(line)
+            else:
+                sys.stderr.write(line)
+
+    @classmethod
+    def _register_from_module(cls, module, quiet: bool = False,
+                              config_accumulator: Optional[Dict[str, List[dict]]] = None) -> Dict[str, List[str]]:
+        """Scan and register hook implementations from module, return {hook_type: [class names]}
+
+        Module globals are read with vars() (no descriptor or __getattr__ evaluation);
+        a module that declares __all__ only contributes the names listed there.
+        """
+        found: Dict[str, List[str]] = {}
+        interface_events = cls._INTERFACE_EVENTS
+        namespace = vars(module)
+        exported = namespace.get("__all__")
+        if exported is not None:
+            candidates = [namespace[name] for name in exported if name in namespace]
+        else:
+            candidates = list(namespace.values())
+        for obj in candidates:
+            if not isinstance(obj, type) or obj in interface_events:
+                continue
+            events = cls._events_of(obj)
+            if not events:
+                continue
+            if hasattr(obj, "_hook_config") and not obj._hook_config.get("enabled", True):
+                continue
+            for hook_type in events:
+                cls.register(hook_type, obj, quiet=quiet, config_accumulator=config_accumulator)
+                names = found.setdefault(hook_type, [])
+                if obj.__name__ not in names:
+                    names.append(obj.__name__)
+        return found
 
     @classmethod
-    def _register_from_module(cls, module, quiet: bool = False):
-        """Scan and register hook implementations from module"""
-        for _, obj in inspect.getmembers(module, inspect.isclass):
-            for hook_type, interface in cls._INTERFACE_MAP.items():
-                if issubclass(obj, interface) and obj != interface:
-                    if hasattr(obj, "_hook_config"):
-                        if not obj._hook_config.get("enabled", True):
+    def _events_of(cls, obj: Type) -> Tuple[str, ...]:
+        """Hook types whose interface is in obj's MRO, computed once per class per scan
+
+        Framework classes imported by every hook file (models, ToolName, ...) are
+        checked once instead of once per module that imports them. invalidate()
+        drops the cache so classes of reloaded modules are not kept alive.
+        """
+        events = cls._class_events.get(obj)
+        if events is None:
+            interface_events = cls._INTERFACE_EVENTS
+            events = tuple(interface_events[base] for base in obj.__mro__ if base in interface_events)
+            cls._class_events[obj] = events
+        return events
+
+    @staticmethod
+    def _load_scan_cache(cache_path: Path) -> Dict[str, Any]:
+        """Load scan cache manifest, return empty dict if missing or corrupted"""
+        try:
+            cache = _json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    @staticmethod
+    def _save_scan_cache(cache_path: Path, cache: Dict[str, Any]):
+        """Write scan cache manifest atomically (temp file + rename), ignore write failures"""
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(_json_dumps_bytes(cache))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _load_module(py_file: Any, rel_path: str, stamp: List[int]):
+        """Load a hook file as module, executing it at most once per process per file version
+
+        The module is kept in sys.modules under "easycchooks._scan.<relative path>" with the
+        (mtime, size) stamp it was loaded from, so later scans reuse the same module and class
+        objects. SourceFileLoader reuses bytecode from __pycache__.
+        """
+        module_name = _SCAN_MODULE_PREFIX + rel_path[:-len(".py")].replace("/", ".")
+        mod = sys.modules.get(module_name)
+        if mod is not None and getattr(mod, "__easycchooks_stamp__", None) == stamp:
+            return mod
+
+        import importlib.util
+        import importlib.machinery
+
+        loader = importlib.machinery.SourceFileLoader(module_name, os.fspath(py_file))
+        spec = importlib.util.spec_from_loader(module_name, loader)
+        mod = importlib.util.module_from_spec(spec)
+        mod.__easycchooks_stamp__ = stamp
+        # Registered before exec like a regular import (dataclasses and self-imports look it up)
+        sys.modules[module_name] = mod
+        try:
+            loader.exec_module(mod)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        return mod
+
+    @classmethod
+    def _iter_hook_files(cls, hooks_dir: Path, include_tests: bool):
+        """Yield (relative posix path, file) for hook .py files under hooks_dir
+
+        file is an os.DirEntry from the directory walk, or a Path for manifest entries;
+        both provide .name, .stat() and os.fspath().
+        If easycchooks.manifest exists only the files it lists are yielded (plus tests/ when
+        include_tests), otherwise hooks_dir is walked recursively, pruning tests/,
+        hidden directories, __pycache__ and virtualenvs.
+        """
+        manifest_path = hooks_dir / _HOOKS_MANIFEST_FILE
+        if manifest_path.is_file():
+            with open(manifest_path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        py_file = hooks_dir / line
+                        try:
+                            rel_path = py_file.relative_to(hooks_dir)
+                        except ValueError:
+                            rel_path = None
+                        if rel_path is None or ".." in rel_path.parts:
+                            print(f"⚠️  Skipping manifest entry outside hooks directory: {line}", file=sys.stderr)
                             continue
-                    cls.register(hook_type, obj, quiet=quiet)
+                        rel_path = rel_path.as_posix()
+                        # tests/ is never taken from the manifest: skipped by default, walked below otherwise
+                        if not rel_path.startswith("tests/"):
+                            yield rel_path, py_file
+            if include_tests:
+                yield from cls._scandir_py_files(os.path.join(hooks_dir, "tests"), "tests/")
+            return
+
+        yield from cls._scandir_py_files(str(hooks_dir), "", skip_tests=not include_tests)
+
+    @classmethod
+    def _scandir_py_files(cls, dir_path: str, rel_prefix: str, skip_tests: bool = False):
+        """Recursively yield (relative posix path, os.DirEntry) for .py files with os.scandir
+
+        Same order as a sorted os.walk: files of a directory first, then its subdirectories.
+        DirEntry caches its stat() result (free on Windows), so the scan stats each file once.
+        skip_tests prunes the tests/ directory directly under dir_path.
+        """
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            return
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir():
+                # Like os.walk, symlinked directories are not followed
+                if not (entry.is_symlink() or name.startswith(".") or name in _SCAN_SKIP_DIRS
+                        or (skip_tests and name == "tests")):
+                    subdirs.append(entry)
+            elif name.endswith(".py"):
+                yield rel_prefix + name, entry
+        for entry in subdirs:
+            yield from cls._scandir_py_files(entry.path, f"{rel_prefix}{entry.name}/")
 
     @classmethod
-    def scan_and_register(cls, quiet: bool = False, include_tests: bool = False):
-        """Scan and register hook implementations in current file and .py files in the same directory"""
+    def scan_and_register(cls, quiet: bool = True, include_tests: bool = False,
+                          config_accumulator: Optional[Dict[str, List[dict]]] = None):
+        """Scan and register hook implementations in current file and .py files in the same directory
+
+        Each file's (mtime, size) and the classes it registered are recorded in the scan cache;
+        unchanged files that registered no hooks are not executed again.
+        Modules are loaded by SourceFileLoader, which reuses bytecode from __pycache__.
+        Repeated calls in the same process return immediately (see invalidate); a non-quiet
+        repeat still reports the registered hooks.
+        If config_accumulator is given it is filled with the generated settings.json hook
+        entries ({hook_type: [entries]}) during the same pass, same result as generate_config.
+        """
+        if cls._scanned_tests is not None and (cls._scanned_tests or not include_tests):
+            if not quiet:
+                sys.stderr.write("".join(f"✓ Registered: {hook_type}.{hook_class.__name__}\n"
+                                         for hook_type, hook_list in cls._hooks.items()
+                                         for hook_class in hook_list))
+            if config_accumulator is not None:
+                config_accumulator.update(cls.generate_config()["hooks"])
+            return
+        cls._pending_log = []
+        try:
+            cls._scan(quiet, include_tests, config_accumulator)
+            if config_accumulator:
+                # Keep the hook type order of generate_config
+                ordered = {t: config_accumulator[t] for t in cls._hooks if t in config_accumulator}
+                config_accumulator.clear()
+                config_accumulator.update(ordered)
+        finally:
+            pending, cls._pending_log = cls._pending_log, None
+            if pending:
+                sys.stderr.write("".join(pending))
+                sys.stderr.flush()
+        cls._scanned_tests = include_tests
+
+    @classmethod
+    def _scan(cls, quiet: bool, include_tests: bool, config_accumulator: Optional[Dict[str, List[dict]]]):
+        """scan_and_register body: load hook files and refresh the scan cache"""
         # 1. Scan current file
-        cls._register_from_module(sys.modules[__name__], quiet=quiet)
+        cls._register_from_module(sys.modules[__name__], quiet=quiet, config_accumulator=config_accumulator)
 
         # 2. Recursively scan .py files in the same directory and subdirectories
+        # tests/ is skipped by default to avoid loading example hooks as production hooks
         hooks_dir = Path(__file__).parent
-        for py_file in hooks_dir.rglob("*.py"):
-            if py_file.name == Path(__file__).name:
+        cache_path = hooks_dir / _SCAN_CACHE_FILE
+        cache = cls._load_scan_cache(cache_path)
+        new_cache: Dict[str, Any] = {}
+        self_name = os.path.basename(__file__)
+        for rel_path, py_file in cls._iter_hook_files(hooks_dir, include_tests):
+            if py_file.name == self_name:
+                continue
+            try:
+                st = py_file.stat()
+            except OSError as e:
+                print(f"⚠️  Failed to load {py_file.name}: {e}", file=sys.stderr)
+                continue
+            stamp = [st.st_mtime_ns, st.st_size]
+            cached = cache.get(rel_path)
+            if isinstance(cached, dict) and cached.get("stat") == stamp and cached.get("hooks") == {}:
+                new_cache[rel_path] = cached
                 continue
-            # Skip tests/ directory by default to avoid loading example hooks as production hooks
-            if not include_tests:
-                try:
-                    py_file.relative_to(hooks_dir / "tests")
-                    continue
-                except ValueError:
-                    pass
-            module_name = py_file.stem
             try:
-                spec = importlib.util.spec_from_file_location(module_name, py_file)
-                if spec and spec.loader:
-                    mod = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(mod)
-                    cls._register_from_module(mod, quiet=quiet)
+                found = cls._register_from_module(cls._load_module(py_file, rel_path, stamp), quiet=quiet,
+                                                  config_accumulator=config_accumulator)
             except Exception as e:
                 print(f"⚠️  Failed to load {py_file.name}: {e}", file=sys.stderr)
+                continue
+            new_cache[rel_path] = {"stat": stamp, "hooks": found}
+
+        if new_cache != cache:
+            cls._save_scan_cache(cache_path, new_cache)
+
+    @classmethod
+    def invalidate(cls):
+        """Clear registered hooks and cached instances so the next scan_and_register rescans"""
+        for hooks in cls._hooks.values():
+            hooks.clear()
+        for names in cls._registered.values():
+            names.clear()
+        cls._hooks_by_name.clear()
+        cls._instance_cache.clear()
+        cls._meta_cache.clear()
+        cls._class_events.clear()
+        cls._count = 0
+        cls._scanned_tests = None
+
+    @classmethod
+    def load_cached_hook(cls, hook_class_name: str) -> bool:
+        """Register a single hook using the scan cache, loading only the file that defines it
+
+        Returns False on cache miss (unknown class or file changed since last scan),
+        in which case the caller should fall back to scan_and_register.
+        """
+        # Only walk this module when it defines the requested name (hooks written directly in this file)
+        this_module = sys.modules[__name__]
+        if isinstance(getattr(this_module, hook_class_name, None), type):
+            cls._register_from_module(this_module, quiet=True)
+            if cls.get_hook(hook_class_name):
+                return True
+
+        hooks_dir = Path(__file__).parent
+        cache = cls._load_scan_cache(hooks_dir / _SCAN_CACHE_FILE)
+        for rel_path, entry in cache.items():
+            # tests/ entries are only recorded by the test command, never used for execute
+            if rel_path.startswith("tests/") or not isinstance(entry, dict):
+                continue
+            hooks = entry.get("hooks")
+            if not isinstance(hooks, dict) or not any(hook_class_name in names for names in hooks.values()):
+                continue
+            py_file = hooks_dir / rel_path
+            try:
+                st = py_file.stat()
+                stamp = [st.st_mtime_ns, st.st_size]
+                if entry.get("stat") != stamp:
+                    return False
+                cls._register_from_module(cls._load_module(py_file, rel_path, stamp), quiet=True)
+            except Exception:
+                return False
+            return cls.get_hook(hook_class_name) is not None
+        return False
 
     @classmethod
     def get_hook(cls, hook_class_name: str) -> Optional[Type[BaseHook]]:
         """Get hook by class name"""
-        for hooks in cls._hooks.values():
-            for hook in hooks:
-                if hook.__name__ == hook_class_name:
-                    return hook
-        return None
+        return cls._hooks_by_name.get(hook_class_name)
 
     @classmethod
     def get_all(cls) -> Dict[str, List[Type[BaseHook]]]:
         """Get all registered hooks"""
         return cls._hooks
 
+    @classmethod
+    def count(cls) -> int:
+        """Total number of registered hooks (a class implementing several interfaces counts once per type)"""
+        return cls._count
+
+    @classmethod
+    def _probe(cls, hook_class: Type[BaseHook]) -> BaseHook:
+        """Get a shared instance of hook class, created at most once per process"""
+        instance = cls._instance_cache.get(hook_class)
+        if instance is None:
+            instance = cls._instance_cache[hook_class] = hook_class()
+        return instance
+
+    @classmethod
+    def _hook_attr(cls, hook_class: Type[BaseHook], name: str, default: Any) -> Any:
+        """Read hook attribute from class, instantiating only when it is not a plain str/int (property, cached_property, ...)"""
+        value = getattr(hook_class, name, default)
+        if not isinstance(value, (str, int)):
+            value = getattr(cls._probe(hook_class), name, default)
+        return value
+
+    @classmethod
+    def _get_meta(cls, hook_class: Type[BaseHook]) -> Dict[str, Any]:
+        """matcher / timeout of hook class (its _hook_config when set), resolved once per class"""
+        meta = cls._meta_cache.get(hook_class)
+        if meta is None:
+            if hasattr(hook_class, "_hook_config"):
+                meta = hook_class._hook_config
+            else:
+                meta = {
+                    "matcher": cls._hook_attr(hook_class, "matcher", "*"),
+                    "timeout": cls._hook_attr(hook_class, "timeout", 10)
+                }
+            cls._meta_cache[hook_class] = meta
+        return meta
+
+    @classmethod
+    def _config_entry(cls, hook_type: str, hook: Type[BaseHook]) -> Optional[dict]:
+        """Build the settings.json entry of one hook, None if it cannot be instantiated"""
+        try:
+            hook_config = cls._get_meta(hook)
+        except Exception as e:
+            print(f"⚠️  Cannot create instance: {hook.__name__} - {e}")
+            return None
+
+        command = {
+            "type": "command",
+            "command": _MANAGED_COMMAND_PREFIX + hook.__name__,
+            "timeout": hook_config.get("timeout", 10)
+        }
+        # One fixed shape per hook type: tool-level hooks carry a matcher, the rest do not
+        if hook_type in _TOOL_LEVEL_HOOK_TYPES:
+            return {"hooks": [command], "matcher": hook_config.get("matcher", "*")}
+        return {"hooks": [command]}
+
     @classmethod
     def generate_config(cls) -> dict:
         """Generate settings.json configuration"""
@@ -718,33 +1174,9 @@ class HookRegistry:
                 continue
             hook_configs = []
             for hook in hooks:
-                try:
-                    instance = hook()
-                except Exception as e:
-                    print(f"⚠️  Cannot create instance: {hook.__name__} - {e}")
-                    continue
-
-                if hasattr(hook, "_hook_config"):
-                    hook_config = hook._hook_config
-                else:
-                    hook_config = {
-                        "matcher": getattr(instance, "matcher", "*"),
-                        "timeout": getattr(instance, "timeout", 10)
-                    }
-
-                hook_entry = {
-                    "hooks": [{
-                        "type": "command",
-                        "command": f'python3 "$CLAUDE_PROJECT_DIR"/.claude/hooks/easyCcHooks.py execute {hook.__name__}',
-                        "timeout": hook_config.get("timeout", 10)
-                    }]
-                }
-
-                tool_level_hooks = ["PreToolUse", "PermissionRequest", "PostToolUse", "Notification", "PreCompact"]
-                if hook_type in tool_level_hooks:
-                    hook_entry["matcher"] = hook_config.get("matcher", "*")
-
-                hook_configs.append(hook_entry)
+                hook_entry = cls._config_entry(hook_type, hook)
+                if hook_entry is not None:
+                    hook_configs.append(hook_entry)
             config["hooks"][hook_type] = hook_configs
         return config
 
@@ -756,8 +1188,11 @@ class HookRegistry:
             if hooks:
                 print(f"\n{hook_type}:")
                 for hook in hooks:
-                    instance = hook()
-                    print(f"  - {hook.__name__}: {instance.description}")
+                    if hook.description is BaseHook.description:
+                        description = hook._description
+                    else:
+                        description = cls._hook_attr(hook, "description", "No description")
+                    print(f"  - {hook.__name__}: {description}")
                     total += 1
         print(f"\nTotal: {total} hooks")
 
@@ -773,7 +1208,10 @@ class HookExecutor:
     def execute_from_stdin(hook_class_name: str):
         """Read input from stdin and execute specified hook"""
         try:
-            input_data = json.load(sys.stdin)
+            # Whole payload read as bytes in one call and parsed without a text decode step
+            input_data = _json_loads(sys.stdin.buffer.read())
+            if type(input_data) is not dict:
+                raise ValueError("Hook input must be a JSON object")
             hook_event = input_data.get("hook_event_name")
             if not hook_event:
                 raise ValueError("Missing hook_event_name field")
@@ -788,20 +1226,22 @@ class HookExecutor:
 
             input_model = input_model_class.from_dict(input_data)
             output = hook_class().execute(input_model)
-            print(json.dumps(output.to_dict(), ensure_ascii=False))
+            _write_json_line(output.to_dict())
             sys.exit(0)
 
         except Exception as e:
             print(f"Hook execution error: {e}", file=sys.stderr)
-            print(json.dumps({"continue": True, "suppressOutput": False}))
+            _write_json_line({"continue": True, "suppressOutput": False})
             sys.exit(1)
 
     @staticmethod
     def test_hook(hook_class_name: str, input_file: str):
         """Test specified hook"""
         try:
-            with open(input_file) as f:
-                input_data = json.load(f)
+            with open(input_file, "rb") as f:
+                input_data = _json_loads(f.read())
+            if type(input_data) is not dict:
+                raise ValueError("Hook input must be a JSON object")
 
             hook_event = input_data.get("hook_event_name")
             if not hook_event:
@@ -823,7 +1263,7 @@ class HookExecutor:
 
             output = hook_class().execute(input_model)
             print(f"📤 Output:")
-            print(json.dumps(output.to_dict(), indent=2, ensure_ascii=False))
+            print(_json_dumps(output.to_dict(), indent=True))
             print()
             print("✅ Test passed")
 
@@ -840,28 +1280,24 @@ class ConfigManager:
     """settings.json configuration manager"""
 
     @staticmethod
-    def _is_managed_command(command: str) -> bool:
-        """Check if command is an automatically generated managed command by easyCcHooks"""
-        if not isinstance(command, str):
-            return False
-        return command.startswith('python3 "$CLAUDE_PROJECT_DIR"/.claude/hooks/easyCcHooks.py execute ')
+    def _is_managed_hook_entry(hook_entry: Any) -> bool:
+        """Check if hook entry is automatically managed by easyCcHooks
 
-    @classmethod
-    def _is_managed_hook_entry(cls, hook_entry: Any) -> bool:
-        """Check if hook entry is automatically managed by easyCcHooks"""
-        if not isinstance(hook_entry, dict):
+        Managed entries contain only command hooks whose command starts with _MANAGED_COMMAND_PREFIX;
+        checked in one pass that stops at the first entry that does not qualify.
+        """
+        # Entries come from parsed JSON, so exact type() checks are enough (no isinstance MRO walk)
+        if type(hook_entry) is not dict:
             return False
 
-        commands = hook_entry.get("hooks")
-        if not isinstance(commands, list) or not commands:
+        if type(commands := hook_entry.get("hooks")) is not list or not commands:
             return False
 
         for command_entry in commands:
-            if not isinstance(command_entry, dict):
-                return False
-            if command_entry.get("type") != "command":
+            if type(command_entry) is not dict or command_entry.get("type") != "command":
                 return False
-            if not cls._is_managed_command(command_entry.get("command")):
+            command = command_entry.get("command")
+            if type(command) is not str or not command.startswith(_MANAGED_COMMAND_PREFIX):
                 return False
         return True
 
@@ -871,58 +1307,66 @@ class ConfigManager:
         - Replace managed entries (prevent stale entries)
         - Preserve user-written entries
         """
-        if not isinstance(existing_hooks, dict):
+        if type(existing_hooks) is not dict:
             existing_hooks = {}
 
-        merged_hooks = {}
+        is_managed = cls._is_managed_hook_entry
+        # dict.fromkeys(dict) sizes the table for all existing hook types up front (no rehash while
+        # filling); types that end up empty are removed again
+        merged_hooks = dict.fromkeys(existing_hooks)
 
         # First preserve user-written entries in original order, then append currently scanned managed entries
         for hook_type, hook_entries in existing_hooks.items():
-            preserved_entries = []
-            if isinstance(hook_entries, list):
-                preserved_entries = [
-                    entry for entry in hook_entries
-                    if not cls._is_managed_hook_entry(entry)
-                ]
-            generated_entries = generated_hooks.get(hook_type, [])
-            combined_entries = preserved_entries + generated_entries
+            if type(hook_entries) is list:
+                combined_entries = [entry for entry in hook_entries if not is_managed(entry)]
+                combined_entries.extend(generated_hooks.get(hook_type, ()))
+            else:
+                combined_entries = list(generated_hooks.get(hook_type, ()))
             if combined_entries:
                 merged_hooks[hook_type] = combined_entries
+            else:
+                del merged_hooks[hook_type]
 
         # New managed hook types
         for hook_type, generated_entries in generated_hooks.items():
-            if hook_type in merged_hooks:
-                continue
-            if generated_entries:
+            if generated_entries and hook_type not in existing_hooks:
                 merged_hooks[hook_type] = generated_entries
 
         return merged_hooks
 
     @staticmethod
-    def update_settings(settings_path: Path, backup: bool = True):
-        """Update settings.json and inject hook configuration"""
-        if settings_path.exists():
-            with open(settings_path, encoding="utf-8") as f:
-                config = json.load(f)
+    def update_settings(settings_path: Path, backup: bool = True,
+                        generated_hooks: Optional[Dict[str, List[dict]]] = None):
+        """Update settings.json and inject hook configuration
+
+        generated_hooks: managed entries collected during scan (see scan_and_register's
+        config_accumulator); generated from the registry when omitted.
+        """
+        try:
+            # One read of the whole file, parsed from bytes
+            raw = settings_path.read_bytes()
+        except FileNotFoundError:
+            raw = None
+        if raw is not None:
+            # An empty settings.json is treated like a missing one
+            config = _json_loads(raw) if raw.strip() else {}
             if backup:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
                 backup_filename = f"{settings_path.stem}.backup.{timestamp}.json"
                 backup_path = settings_path.parent / backup_filename
-                with open(backup_path, "w", encoding="utf-8") as f:
-                    json.dump(config, f, indent=2, ensure_ascii=False)
+                # Byte-for-byte copy of what was read: no re-serialization, user formatting preserved
+                backup_path.write_bytes(raw)
                 print(f"✓ Backed up: {backup_path}")
         else:
             config = {}
 
-        new_hooks = HookRegistry.generate_config()
-        config["hooks"] = ConfigManager._merge_hooks(
-            config.get("hooks"),
-            new_hooks.get("hooks", {})
-        )
+        if generated_hooks is None:
+            generated_hooks = HookRegistry.generate_config()["hooks"]
+        config["hooks"] = ConfigManager._merge_hooks(config.get("hooks"), generated_hooks)
 
         settings_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(settings_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        # Serialized straight to UTF-8 bytes (orjson when available) and written in one call
+        settings_path.write_bytes(_json_dumps_bytes(config, indent=True, newline=True))
         print(f"✓ Configuration updated: {settings_path}")
 
 
@@ -936,16 +1380,17 @@ SETTINGS_PATH = PROJECT_ROOT / ".claude/settings.json"
 def cmd_scan(args):
     """Scan and register all hooks"""
     print("🔍 Scanning hook implementations...")
-    HookRegistry.scan_and_register()
-    total = sum(len(hooks) for hooks in HookRegistry.get_all().values())
+    HookRegistry.scan_and_register(quiet=False)
+    total = HookRegistry.count()
     print(f"\n✅ Scan complete, registered {total} hooks")
 
 
 def cmd_update_config(args):
     """Update settings.json configuration"""
     print("📝 Updating configuration...")
-    HookRegistry.scan_and_register()
-    ConfigManager.update_settings(SETTINGS_PATH, backup=not args.no_backup)
+    generated_hooks: Dict[str, List[dict]] = {}
+    HookRegistry.scan_and_register(config_accumulator=generated_hooks)
+    ConfigManager.update_settings(SETTINGS_PATH, backup=not args.no_backup, generated_hooks=generated_hooks)
     print("\n✅ Configuration update complete")
 
 
@@ -964,17 +1409,45 @@ def cmd_test(args):
 
 def cmd_execute(args):
     """Execute hook (called by Claude Code)"""
-    HookRegistry.scan_and_register(quiet=True)
-    HookExecutor.execute_from_stdin(args.hook_name)
+    _execute_hook(args.hook_name)
+
+
+def _execute_hook(hook_name: str):
+    """Body of cmd_execute, also called directly by main's argparse-free fast path"""
+    # Fast path: load only the file defining the hook; full scan on cache miss
+    if not HookRegistry.load_cached_hook(hook_name):
+        HookRegistry.scan_and_register()
+    HookExecutor.execute_from_stdin(hook_name)
+
+
+# Shared urllib3 pool, created on first use so both upgrade requests reuse one TLS connection
+_HTTP_POOL = None
 
 
-def _fetch_url(url: str) -> str:
-    """Fetch URL content via urllib"""
+def _fetch_url(url: str) -> bytes:
+    """Fetch raw URL content (pooled urllib3 when installed, stdlib urllib otherwise)"""
+    global _HTTP_POOL
+    try:
+        import urllib3
+    except ImportError:
+        urllib3 = None
+
+    if urllib3 is not None:
+        if _HTTP_POOL is None:
+            _HTTP_POOL = urllib3.PoolManager()
+        try:
+            resp = _HTTP_POOL.request("GET", url, timeout=10)
+        except urllib3.exceptions.HTTPError as e:
+            raise RuntimeError(f"Network request failed: {e}") from e
+        if resp.status >= 400:
+            raise RuntimeError(f"Network request failed: HTTP {resp.status}")
+        return resp.data
+
     import urllib.request
     import urllib.error
     try:
         with urllib.request.urlopen(url, timeout=10) as resp:
-            return resp.read().decode("utf-8")
+            return resp.read()
     except urllib.error.URLError as e:
         raise RuntimeError(f"Network request failed: {e}") from e
 
@@ -985,7 +1458,7 @@ def cmd_upgrade(args):
     print("Checking remote version...")
 
     try:
-        remote_version = _fetch_url(_VERSION_URL).strip()
+        remote_version = _fetch_url(_VERSION_URL).decode("utf-8").strip()
     except RuntimeError as e:
         print(f"❌ {e}", file=sys.stderr)
         sys.exit(1)
@@ -1011,19 +1484,41 @@ def cmd_upgrade(args):
 
     local_path = Path(__file__)
 
-    # Backup current file
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Stage the downloaded bytes as-is (no decode/encode round-trip) next to the current file,
+    # so a failed write never leaves a missing or truncated easyCcHooks.py
+    tmp_path = local_path.with_name(f"{local_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(new_content)
+        os.chmod(tmp_path, local_path.stat().st_mode)
+    except OSError as e:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        print(f"❌ Failed to write update: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # Backup current file by moving it aside instead of copying it
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     backup_path = local_path.with_suffix(f".backup.{timestamp}.py")
-    backup_path.write_text(local_path.read_text(encoding="utf-8"), encoding="utf-8")
+    os.replace(local_path, backup_path)
     print(f"✓ Backed up: {backup_path.name}")
 
-    # Write new file
-    local_path.write_text(new_content, encoding="utf-8")
+    os.replace(tmp_path, local_path)
     print(f"✓ Updated: {local_path.name}")
     print(f"\n✅ Upgrade complete: {__version__} → {remote_version}")
 
 
 def main():
+    # "execute <HookName>" runs on every tool call: dispatch it without importing or building argparse
+    argv = sys.argv
+    if len(argv) == 3 and argv[1] == "execute" and not argv[2].startswith("-"):
+        _execute_hook(argv[2])
+        return
+
+    # CLI-only dependency, imported here to keep the execute path light
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Claude Code Hooks Management Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -6,16 +6,20 @@
 如果需要在正式项目中使用,请复制到 .claude/hooks/ 目录并在 easyCcHooks.py 中注册。
 """
 
+import os
 import re
 import sys
+import time
 from pathlib import Path
-from datetime import datetime
 
 # 将 hooks 目录加入 path,以便导入 easyCcHooks
 HOOKS_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(HOOKS_DIR))
 
 from easyCcHooks import (
+    ALLOW,
+    ASK,
+    DENY,
     IPreToolUse,
     ISessionStart,
     PreToolUseInput,
@@ -40,6 +44,12 @@ class ValidateBashCommand(IPreToolUse):
     - 请求用户确认 sudo 命令
     """
 
+    # Patterns are compiled once at class definition; system directories are fused into one alternation
+    _DANGEROUS_PATHS = ("/bin", "/boot", "/dev", "/etc", "/lib", "/proc", "/sbin", "/sys", "/usr")
+    _RM_ROOT_RE = re.compile(r"\brm\s+.*-rf\s+/\s*$")
+    _RM_SYSDIR_RE = re.compile(r"\brm\s+.*-rf\s+(" + "|".join(re.escape(p) for p in _DANGEROUS_PATHS) + ")")
+    _SUDO_RE = re.compile(r"\bsudo\b")
+
     @property
     def matcher(self) -> str:
         return ToolName.Bash
@@ -47,28 +57,29 @@ class ValidateBashCommand(IPreToolUse):
     def execute(self, input_data: PreToolUseInput) -> PreToolUseOutput:
         command = input_data.tool_input.get("command", "")
 
-        if re.search(r"\brm\s+.*-rf\s+/\s*$", command):
-            return PreToolUseOutput(
-                permission_decision="deny",
-                permission_decision_reason="🚫 禁止删除根目录"
-            )
+        # Both rm patterns need these substrings; most commands skip the regex engine entirely
+        if "rm" in command and "-rf" in command:
+            if self._RM_ROOT_RE.search(command):
+                return PreToolUseOutput(
+                    permission_decision=DENY,
+                    permission_decision_reason="🚫 禁止删除根目录"
+                )
 
-        dangerous_paths = ["/bin", "/boot", "/dev", "/etc", "/lib", "/proc", "/sbin", "/sys", "/usr"]
-        for path in dangerous_paths:
-            if re.search(rf"\brm\s+.*-rf\s+{path}", command):
+            match = self._RM_SYSDIR_RE.search(command)
+            if match:
                 return PreToolUseOutput(
-                    permission_decision="deny",
-                    permission_decision_reason=f"🚫 禁止删除系统目录: {path}"
+                    permission_decision=DENY,
+                    permission_decision_reason=f"🚫 禁止删除系统目录: {match.group(1)}"
                 )
 
-        if "sudo" in command:
+        if self._SUDO_RE.search(command):
             return PreToolUseOutput(
-                permission_decision="ask",
+                permission_decision=ASK,
                 permission_decision_reason="⚠️  需要管理员权限,请确认"
             )
 
         return PreToolUseOutput(
-            permission_decision="allow",
+            permission_decision=ALLOW,
             permission_decision_reason="✓ 命令安全"
         )
 
@@ -87,20 +98,28 @@ class WatchPreToolUse(IPreToolUse):
     - 不阻止任何操作
     """
 
+    # O_APPEND descriptor of watch.log, opened on first use and kept for the process
+    _log_fd = None
+
     @property
     def matcher(self) -> str:
         return ToolName.All
 
-    def execute(self, input_data: PreToolUseInput) -> PreToolUseOutput:
-        log_file = Path(__file__).parent / "watch.log"
-        log_file.parent.mkdir(parents=True, exist_ok=True)
+    @classmethod
+    def _get_log_fd(cls) -> int:
+        if cls._log_fd is None:
+            log_file = Path(__file__).parent / "watch.log"
+            cls._log_fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return cls._log_fd
 
-        with open(log_file, "a", encoding="utf-8") as f:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            f.write(f"[{timestamp}] {input_data.tool_name}: {input_data.tool_input}\n")
+    def execute(self, input_data: PreToolUseInput) -> PreToolUseOutput:
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        line = f"[{timestamp}] {input_data.tool_name}: {input_data.tool_input}\n"
+        # One write(2) per event; O_APPEND keeps concurrent hook processes from interleaving lines
+        os.write(self._get_log_fd(), line.encode("utf-8"))
 
         return PreToolUseOutput(
-            permission_decision="allow",
+            permission_decision=ALLOW,
             permission_decision_reason="✓ 监控记录完成"
         )
 
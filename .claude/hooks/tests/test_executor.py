@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+CLI = Path(__file__).parent.parent / "easyCcHooks.py"
+INPUT_SAFE = Path(__file__).parent / "test_input_safe.json"
+
+# Runs the execute command in-process and reports which CLI-only modules got imported
+_IMPORT_PROBE = """
+import runpy, sys
+sys.argv = [sys.argv[1], "execute", "ValidateBashCommand"]
+try:
+    runpy.run_path(sys.argv[0], run_name="__main__")
+except SystemExit:
+    pass
+sys.stderr.write("\\nimported:" + ",".join(m for m in ("argparse", "urllib.request", "urllib3") if m in sys.modules))
+"""
+
+
+def _execute(hook_name, stdin_bytes):
+    return subprocess.run(
+        [sys.executable, str(CLI), "execute", hook_name],
+        input=stdin_bytes,
+        capture_output=True,
+        timeout=10
+    )
+
+
+class ExecuteFromStdinTests(unittest.TestCase):
+    def test_reads_utf8_bytes_and_writes_utf8_json(self):
+        payload = {
+            "session_id": "test-utf8",
+            "transcript_path": "/tmp/test.jsonl",
+            "cwd": "/tmp",
+            "permission_mode": "default",
+            "hook_event_name": "PreToolUse",
+            "tool_name": "Bash",
+            "tool_input": {"command": "echo 你好"},
+            "tool_use_id": "test-utf8",
+        }
+        result = _execute("ValidateBashCommand", json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertTrue(result.stdout.endswith(b"\n"))
+        output = json.loads(result.stdout)
+        self.assertEqual(output["hookSpecificOutput"]["permissionDecision"], "allow")
+
+    def test_invalid_input_falls_back_to_continue(self):
+        result = _execute("ValidateBashCommand", b"not json")
+
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(json.loads(result.stdout), {"continue": True, "suppressOutput": False})
+        self.assertIn(b"Hook execution error", result.stderr)
+
+    def test_non_object_input_is_rejected(self):
+        result = _execute("ValidateBashCommand", b"[1, 2]")
+
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(json.loads(result.stdout), {"continue": True, "suppressOutput": False})
+        self.assertIn(b"Hook input must be a JSON object", result.stderr)
+
+
+class ExecuteImportTests(unittest.TestCase):
+    def test_execute_does_not_import_cli_only_modules(self):
+        result = subprocess.run(
+            [sys.executable, "-c", _IMPORT_PROBE, str(CLI)],
+            input=INPUT_SAFE.read_bytes(),
+            capture_output=True,
+            timeout=10
+        )
+
+        self.assertEqual(json.loads(result.stdout)["hookSpecificOutput"]["permissionDecision"], "allow")
+        self.assertEqual(result.stderr.decode("utf-8").splitlines()[-1], "imported:")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,11 +11,30 @@ import subprocess
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SCRIPT_DIR = Path(__file__).parent
 HOOKS_DIR = SCRIPT_DIR.parent
 CLI = HOOKS_DIR / "easyCcHooks.py"
 
 
+def _json_loads(data: bytes):
+    """解析 hook 输出的 JSON 字节 (优先 orjson, 否则标准库)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_pretty(obj) -> str:
+    """格式化输出 JSON, 保留非 ASCII 字符"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
 def test_hook_via_stdin(hook_name, input_file):
     """通过 stdin 测试 hook (模拟 Claude Code 调用方式)"""
     print(f"\n{'='*60}")
@@ -23,31 +42,31 @@ def test_hook_via_stdin(hook_name, input_file):
     print(f"{'='*60}")
 
     try:
-        with open(input_file) as f:
-            input_data = f.read()
+        # 以字节方式传递输入和读取输出, 与 Claude Code 调用方式一致且无需解码
+        input_data = input_file.read_bytes()
 
         result = subprocess.run(
             [sys.executable, str(CLI), "execute", hook_name],
             input=input_data,
             capture_output=True,
-            text=True,
             timeout=10
         )
 
         if result.returncode == 0:
-            output = json.loads(result.stdout.strip())
-            print(f"  输出: {json.dumps(output, indent=2, ensure_ascii=False)}")
+            output = _json_loads(result.stdout)
+            print(f"  输出: {_json_pretty(output)}")
             print(f"  ✓ 成功")
             return True, output
         else:
             print(f"  ✗ 失败 (退出码 {result.returncode})")
             if result.stderr:
-                print(f"  错误: {result.stderr.strip()}")
+                print(f"  错误: {result.stderr.decode('utf-8', 'replace').strip()}")
             return False, None
 
     except json.JSONDecodeError as e:
+        # orjson.JSONDecodeError 是 json.JSONDecodeError 的子类
         print(f"  ✗ JSON 解析失败: {e}")
-        print(f"  stdout: {result.stdout}")
+        print(f"  stdout: {result.stdout.decode('utf-8', 'replace')}")
         return False, None
     except Exception as e:
         print(f"  ✗ 异常: {e}")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+import dataclasses
+import unittest
+
+import easyCcHooks as hooks
+
+
+class InputModelTests(unittest.TestCase):
+    def test_field_caches_are_built_at_import(self):
+        for model in hooks.INPUT_MODEL_MAP.values():
+            self.assertEqual(model.__dict__["_FIELD_SET"], frozenset(model.__dataclass_fields__))
+
+    def test_from_dict_ignores_unknown_keys(self):
+        data = {
+            "session_id": "s",
+            "transcript_path": "/tmp/t.jsonl",
+            "cwd": "/tmp",
+            "permission_mode": "default",
+            "hook_event_name": "PreToolUse",
+            "tool_name": "Bash",
+            "tool_input": {"command": "ls"},
+            "unknown_field": 1,
+        }
+        model = hooks.PreToolUseInput.from_dict(data)
+        self.assertEqual(model.tool_input, {"command": "ls"})
+        self.assertNotIn("unknown_field", model.to_dict())
+        self.assertEqual(model.to_dict()["tool_use_id"], "")
+
+
+class OutputModelTests(unittest.TestCase):
+    def test_to_dict_fills_given_dict_in_place(self):
+        output = hooks.PreToolUseOutput(permission_decision=hooks.DENY, permission_decision_reason="no",
+                                        system_message="blocked")
+        out = {"extra": 1}
+        self.assertIs(output.to_dict(out), out)
+        self.assertEqual(out, {
+            "extra": 1,
+            "systemMessage": "blocked",
+            "hookSpecificOutput": {
+                "hookEventName": "PreToolUse",
+                "permissionDecision": "deny",
+                "permissionDecisionReason": "no",
+            },
+        })
+        self.assertEqual(output.to_dict(), {k: v for k, v in out.items() if k != "extra"})
+
+    def test_outputs_are_frozen_and_decisions_interned(self):
+        decision = "".join(["de", "ny"])
+        output = hooks.PreToolUseOutput(permission_decision=decision)
+        self.assertIs(output.permission_decision, hooks.DENY)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            output.permission_decision = hooks.ALLOW
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+import contextlib
+import io
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+import easyCcHooks as hooks
+
+
+class ScanMemoizationTests(unittest.TestCase):
+    def setUp(self):
+        hooks.HookRegistry.invalidate()
+
+    def tearDown(self):
+        hooks.HookRegistry.invalidate()
+
+    def test_repeated_scan_is_skipped_until_invalidated(self):
+        hooks.HookRegistry.scan_and_register(quiet=True)
+        hooks.HookRegistry._hooks["PreToolUse"].clear()
+
+        hooks.HookRegistry.scan_and_register(quiet=True)
+        self.assertEqual(hooks.HookRegistry._hooks["PreToolUse"], [])
+
+        hooks.HookRegistry.invalidate()
+        hooks.HookRegistry.scan_and_register(quiet=True)
+        self.assertIsNotNone(hooks.HookRegistry.get_hook("ValidateBashCommand"))
+
+    def test_scan_with_tests_after_production_scan_rescans(self):
+        hooks.HookRegistry.scan_and_register(quiet=True)
+        self.assertEqual(hooks.HookRegistry._scanned_tests, False)
+
+        hooks.HookRegistry.scan_and_register(quiet=True, include_tests=True)
+        self.assertEqual(hooks.HookRegistry._scanned_tests, True)
+
+    def test_verbose_repeat_scan_reports_registered_hooks(self):
+        hooks.HookRegistry.scan_and_register(quiet=True)
+
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            hooks.HookRegistry.scan_and_register(quiet=False)
+        self.assertIn("✓ Registered: PreToolUse.ValidateBashCommand", stderr.getvalue())
+
+    def test_count_matches_registered_hooks(self):
+        hooks.HookRegistry.scan_and_register(quiet=True)
+        total = sum(len(hook_list) for hook_list in hooks.HookRegistry.get_all().values())
+        self.assertGreater(total, 0)
+        self.assertEqual(hooks.HookRegistry.count(), total)
+
+        hooks.HookRegistry.invalidate()
+        self.assertEqual(hooks.HookRegistry.count(), 0)
+
+
+class ModuleReuseTests(unittest.TestCase):
+    def setUp(self):
+        hooks.HookRegistry.invalidate()
+
+    def tearDown(self):
+        hooks.HookRegistry.invalidate()
+
+    def test_rescan_reuses_loaded_module_and_classes(self):
+        hooks.HookRegistry.scan_and_register(quiet=True)
+        first = hooks.HookRegistry.get_hook("ValidateBashCommand")
+
+        hooks.HookRegistry.invalidate()
+        hooks.HookRegistry.scan_and_register(quiet=True)
+        second = hooks.HookRegistry.get_hook("ValidateBashCommand")
+
+        self.assertIs(first, second)
+        self.assertTrue(first.__module__.startswith(hooks._SCAN_MODULE_PREFIX))
+
+    def test_module_is_executed_again_only_when_its_stamp_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            py_file = Path(tmpdir) / "counted_hook.py"
+            py_file.write_text("import builtins\nbuiltins._easycchooks_exec_count += 1\n", encoding="utf-8")
+            import builtins
+            builtins._easycchooks_exec_count = 0
+            rel_path = "tmp_reuse/counted_hook.py"
+            module_name = hooks._SCAN_MODULE_PREFIX + "tmp_reuse.counted_hook"
+            try:
+                first = hooks.HookRegistry._load_module(py_file, rel_path, [1, 10])
+                again = hooks.HookRegistry._load_module(py_file, rel_path, [1, 10])
+                self.assertIs(first, again)
+                self.assertEqual(builtins._easycchooks_exec_count, 1)
+
+                changed = hooks.HookRegistry._load_module(py_file, rel_path, [2, 10])
+                self.assertIsNot(changed, first)
+                self.assertIs(sys.modules[module_name], changed)
+                self.assertEqual(builtins._easycchooks_exec_count, 2)
+            finally:
+                sys.modules.pop(module_name, None)
+                del builtins._easycchooks_exec_count
+
+    def test_failed_module_is_not_left_in_sys_modules(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            py_file = Path(tmpdir) / "broken_hook.py"
+            py_file.write_text("raise RuntimeError('broken')\n", encoding="utf-8")
+            module_name = hooks._SCAN_MODULE_PREFIX + "tmp_reuse.broken_hook"
+
+            with self.assertRaises(RuntimeError):
+                hooks.HookRegistry._load_module(py_file, "tmp_reuse/broken_hook.py", [1, 1])
+            self.assertNotIn(module_name, sys.modules)
+
+
+def _module_from_source(name, source):
+    module = types.ModuleType(name)
+    exec(source, module.__dict__)
+    return module
+
+
+class RegisterFromModuleTests(unittest.TestCase):
+    def setUp(self):
+        hooks.HookRegistry.invalidate()
+
+    def tearDown(self):
+        hooks.HookRegistry.invalidate()
+
+    def test_all_restricts_registered_classes(self):
+        module = _module_from_source("all_hooks", (
+            "from easyCcHooks import IStop, StopOutput\n"
+            "class ExportedStop(IStop):\n"
+            "    def execute(self, input_data):\n"
+            "        return StopOutput()\n"
+            "class PrivateStop(IStop):\n"
+            "    def execute(self, input_data):\n"
+            "        return StopOutput()\n"
+            "__all__ = ['ExportedStop']\n"
+        ))
+        found = hooks.HookRegistry._register_from_module(module, quiet=True)
+
+        self.assertEqual(found, {"Stop": ["ExportedStop"]})
+        self.assertIsNone(hooks.HookRegistry.get_hook("PrivateStop"))
+
+    def test_class_implementing_two_interfaces_registers_under_both(self):
+        module = _module_from_source("multi_hooks", (
+            "from easyCcHooks import IStop, ISubagentStop, StopOutput, SubagentStopOutput\n"
+            "class StopBoth(IStop, ISubagentStop):\n"
+            "    def execute(self, input_data):\n"
+            "        return StopOutput()\n"
+        ))
+        found = hooks.HookRegistry._register_from_module(module, quiet=True)
+
+        self.assertEqual(found, {"Stop": ["StopBoth"], "SubagentStop": ["StopBoth"]})
+        self.assertEqual(hooks.HookRegistry._events_of(module.StopBoth), ("Stop", "SubagentStop"))
+        self.assertEqual(hooks.HookRegistry._events_of(hooks.PreToolUseInput), ())
+
+        hooks.HookRegistry.invalidate()
+        self.assertNotIn(module.StopBoth, hooks.HookRegistry._class_events)
+
+    def test_descriptor_attributes_are_read_from_an_instance(self):
+        module = _module_from_source("descriptor_hooks", (
+            "import functools\n"
+            "from easyCcHooks import IPreToolUse, PreToolUseOutput\n"
+            "class CachedMatcher(IPreToolUse):\n"
+            "    @functools.cached_property\n"
+            "    def matcher(self):\n"
+            "        return 'Bash'\n"
+            "    def execute(self, input_data):\n"
+            "        return PreToolUseOutput()\n"
+        ))
+        hooks.HookRegistry._register_from_module(module, quiet=True)
+
+        self.assertEqual(hooks.HookRegistry._get_meta(module.CachedMatcher)["matcher"], "Bash")
+
+
+class HookManifestTests(unittest.TestCase):
+    def test_manifest_entry_outside_hooks_dir_is_skipped(self):
+        with tempfile.TemporaryDirectory() as tmpdir, tempfile.NamedTemporaryFile(suffix=".py") as outside:
+            hooks_dir = Path(tmpdir)
+            (hooks_dir / hooks._HOOKS_MANIFEST_FILE).write_text(
+                f"inside.py\n{outside.name}\n../escape.py\n", encoding="utf-8"
+            )
+
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                entries = list(hooks.HookRegistry._iter_hook_files(hooks_dir, False))
+
+            self.assertEqual([rel_path for rel_path, _ in entries], ["inside.py"])
+            self.assertIn(outside.name, stderr.getvalue())
+            self.assertIn("../escape.py", stderr.getvalue())
+
+
+class ScanCacheTests(unittest.TestCase):
+    def setUp(self):
+        hooks.HookRegistry.invalidate()
+
+    def tearDown(self):
+        hooks.HookRegistry.invalidate()
+
+    def test_scan_records_hooks_per_file(self):
+        hooks.HookRegistry.scan_and_register(quiet=True)
+        cache_path = Path(hooks.__file__).parent / hooks._SCAN_CACHE_FILE
+        cache = hooks.HookRegistry._load_scan_cache(cache_path)
+        self.assertIn("ValidateBashCommand", cache["example_hooks.py"]["hooks"]["PreToolUse"])
+
+    def test_load_cached_hook_registers_without_full_scan(self):
+        hooks.HookRegistry.scan_and_register(quiet=True)
+        hooks.HookRegistry.invalidate()
+
+        self.assertTrue(hooks.HookRegistry.load_cached_hook("ValidateBashCommand"))
+        self.assertIsNotNone(hooks.HookRegistry.get_hook("ValidateBashCommand"))
+        self.assertIsNone(hooks.HookRegistry._scanned_tests)
+
+    def test_load_cached_hook_misses_for_unknown_hook(self):
+        hooks.HookRegistry.scan_and_register(quiet=True)
+        hooks.HookRegistry.invalidate()
+
+        self.assertFalse(hooks.HookRegistry.load_cached_hook("NoSuchHook"))
+
+
+class ConfigAccumulatorTests(unittest.TestCase):
+    def setUp(self):
+        hooks.HookRegistry.invalidate()
+
+    def tearDown(self):
+        hooks.HookRegistry.invalidate()
+
+    def test_accumulated_config_matches_generate_config(self):
+        generated = {}
+        hooks.HookRegistry.scan_and_register(quiet=True, config_accumulator=generated)
+        self.assertEqual(generated, hooks.HookRegistry.generate_config()["hooks"])
+
+        # Memoized scan still fills the accumulator
+        again = {}
+        hooks.HookRegistry.scan_and_register(quiet=True, config_accumulator=again)
+        self.assertEqual(again, generated)
+
+    def test_hook_meta_is_resolved_once_per_class(self):
+        generated = {}
+        hooks.HookRegistry.scan_and_register(quiet=True, config_accumulator=generated)
+
+        def fail(*args):
+            raise AssertionError("hook attributes resolved again")
+
+        original = hooks.HookRegistry.__dict__["_hook_attr"]
+        hooks.HookRegistry._hook_attr = fail
+        try:
+            self.assertEqual(hooks.HookRegistry.generate_config()["hooks"], generated)
+        finally:
+            hooks.HookRegistry._hook_attr = original
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,8 +8,7 @@ import easyCcHooks as hooks
 
 
 def _reset_registry():
-    for hook_list in hooks.HookRegistry._hooks.values():
-        hook_list.clear()
+    hooks.HookRegistry.invalidate()
 
 
 class UpdateSettingsMergeTests(unittest.TestCase):
@@ -62,6 +61,40 @@ class UpdateSettingsMergeTests(unittest.TestCase):
             self.assertNotIn("SessionEnd", updated["hooks"])
             self.assertNotIn(stale_managed, updated["hooks"]["PreToolUse"])
 
+    def test_writes_non_ascii_as_utf8(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings_path = Path(tmpdir) / "settings.json"
+            settings_path.write_text(json.dumps({"env": {"note": "中文"}}, ensure_ascii=False), encoding="utf-8")
+
+            hooks.ConfigManager.update_settings(settings_path, backup=False)
+            raw = settings_path.read_bytes()
+
+            self.assertIn("中文".encode("utf-8"), raw)
+            self.assertTrue(raw.endswith(b"}\n"))
+            self.assertEqual(json.loads(raw)["env"], {"note": "中文"})
+
+    def test_backup_is_byte_copy_of_original(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings_path = Path(tmpdir) / "settings.json"
+            original = b'{"env": {"note": "\xe4\xb8\xad"},   "hooks": {}}'
+            settings_path.write_bytes(original)
+
+            hooks.ConfigManager.update_settings(settings_path, backup=True)
+            backups = list(Path(tmpdir).glob("settings.backup.*.json"))
+
+            self.assertEqual(len(backups), 1)
+            self.assertEqual(backups[0].read_bytes(), original)
+
+    def test_empty_settings_file_is_treated_as_empty_config(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings_path = Path(tmpdir) / "settings.json"
+            settings_path.write_bytes(b"")
+
+            hooks.ConfigManager.update_settings(settings_path, backup=False)
+            updated = json.loads(settings_path.read_bytes())
+
+            self.assertEqual(updated["hooks"], hooks.HookRegistry.generate_config()["hooks"])
+
 
 if __name__ == "__main__":
     unittest.main()